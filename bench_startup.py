@@ -0,0 +1,140 @@
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+# Startup benchmark for both entry points.
+#
+#   python bench_startup.py               # API and dashboard
+#   python bench_startup.py --only api    # just one of them
+#
+# Import time is measured in a fresh interpreter per run. Time-to-first-request
+# starts the real server process and polls until it answers; for the API we
+# also report time-to-ready (/health/ready), which needs a reachable database.
+# The database is probed once up front; if it is down (or --no-ready is given)
+# time-to-ready is skipped instead of waiting out --timeout on every run.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - t)"
+)
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def measure_import(module, runs):
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET.format(module=module)],
+            cwd=HERE, capture_output=True, text=True, check=True,
+        )
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+    return timings
+
+def wait_for(url, timeout, accept_status=200):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as res:
+                if res.status == accept_status:
+                    return True
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.02)
+    return False
+
+def measure_server(cmd, env, first_url, ready_url, timeout):
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        cmd, cwd=HERE, env={**os.environ, **env},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        first = time.perf_counter() - start if wait_for(first_url, timeout) else None
+        ready = None
+        if ready_url:
+            ready = time.perf_counter() - start if wait_for(ready_url, timeout) else None
+        return first, ready
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+def database_reachable():
+    probe = subprocess.run(
+        [sys.executable, "manage.py", "check-db"],
+        cwd=HERE, capture_output=True, text=True,
+    )
+    return probe.returncode == 0
+
+def api_server(timeout, measure_ready):
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    cmd = [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)]
+    ready_url = f"{base}/health/ready" if measure_ready else None
+    return measure_server(cmd, {}, f"{base}/health/live", ready_url, timeout)
+
+def dashboard_server(timeout, measure_ready):
+    port = free_port()
+    cmd = [sys.executable, "dashboard.py"]
+    # The debug reloader forks a second process; leave it out of the numbers.
+    env = {"DASH_PORT": str(port), "DASH_DEBUG": "0"}
+    return measure_server(cmd, env, f"http://127.0.0.1:{port}/", None, timeout)
+
+ENTRY_POINTS = {
+    "api": ("main", api_server),
+    "dashboard": ("dashboard", dashboard_server),
+}
+
+def fmt(seconds):
+    return "n/a" if seconds is None else f"{seconds * 1000:.0f} ms"
+
+def summarize(samples):
+    ok = [s for s in samples if s is not None]
+    if not ok:
+        return "n/a"
+    return f"median {fmt(statistics.median(ok))}, min {fmt(min(ok))} ({len(ok)}/{len(samples)} ok)"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-start time of the API and dashboard")
+    parser.add_argument("--only", choices=sorted(ENTRY_POINTS))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--no-ready", action="store_true", help="skip the API time-to-ready measurement")
+    args = parser.parse_args(argv)
+
+    names = [args.only] if args.only else list(ENTRY_POINTS)
+    measure_ready = False
+    if "api" in names and not args.no_ready:
+        measure_ready = database_reachable()
+        if not measure_ready:
+            print("database not reachable (see `python manage.py check-db`), skipping time-to-ready")
+
+    for name in names:
+        module, server = ENTRY_POINTS[name]
+        print(f"== {name} ==")
+        print(f"import {module}:        {summarize(measure_import(module, args.runs))}")
+
+        firsts, readies = [], []
+        for _ in range(args.runs):
+            first, ready = server(args.timeout, measure_ready)
+            firsts.append(first)
+            readies.append(ready)
+        print(f"time-to-first-request: {summarize(firsts)}")
+        if name == "api" and measure_ready:
+            print(f"time-to-ready:         {summarize(readies)}")
+
+if __name__ == "__main__":
+    main()
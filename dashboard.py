@@ -1,13 +1,17 @@
 from dash import Dash, dcc, html, Input, Output, State, callback_context, dash_table
-import plotly.express as px
-import pandas as pd
 import requests
 import os
+import threading
 from datetime import date
 import dash
 
+# pandas and plotly are imported inside the chart callback (and preloaded in a
+# background thread once the server is up) to keep process start-up fast.
+
 # Configuration
 API_URL = os.getenv("API_URL", "http://127.0.0.1:8000")
+DASH_PORT = int(os.getenv("DASH_PORT", 8050))
+DASH_DEBUG = os.getenv("DASH_DEBUG", "1") == "1"
 
 app = Dash(__name__, suppress_callback_exceptions=True)
 
@@ -234,6 +238,10 @@ def manage_auth_and_view(login_clicks, logout_clicks, username, password, curren
      State('metrics-table', 'data')]
 )
 def update_dashboard_actions(n, token, sub_met, sub_goal, table_prev, date_val, steps, calories, hr, goal_type, goal_val, table_curr):
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     if not token:
         e = dark_figure(px.bar(title="Waiting for Login..."))
         return e, e, e, e, [], "", "", ""
@@ -297,7 +305,6 @@ def update_dashboard_actions(n, token, sub_met, sub_goal, table_prev, date_val,
     fig_pie = dark_figure(px.pie(ac, values='Count', names='Activity', title='Activity Distribution', color_discrete_sequence=px.colors.sequential.RdBu))
 
     # 4. Gauge
-    import plotly.graph_objects as go
     g_step = next((g for g in goals if g['metric_type'] == 'steps'), None)
     if g_step:
         fig_gauge = go.Figure(go.Indicator(
@@ -325,5 +332,11 @@ def update_dashboard_actions(n, token, sub_met, sub_goal, table_prev, date_val,
 
     return fig_steps, fig_hr, fig_pie, fig_gauge, table_data, stat_met, stat_goal, stat_del
 
+def preload_chart_modules():
+    import pandas
+    import plotly.express
+    import plotly.graph_objects
+
 if __name__ == '__main__':
-    app.run_server(debug=True, port=8050)
+    threading.Thread(target=preload_chart_modules, daemon=True).start()
+    app.run_server(debug=DASH_DEBUG, port=DASH_PORT)
@@ -1,56 +1,108 @@
 from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Annotated
 
+import asyncio
+import logging
 import os
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 import models
 import schemas
 import database
 
-# Database Initialization
-models.Base.metadata.create_all(bind=database.engine)
+logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Health & Fitness Monitor")
+# Schema creation is an explicit step now: `python manage.py init-db`.
+# Importing this module never talks to the database or reads .env.
 
-# Security Configuration
-SECRET_KEY = os.getenv("SECRET_KEY", "supersecretkeyShouldBeChangeInProduction")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+WARM_UP_RETRY_MIN_SECONDS = 1
+WARM_UP_RETRY_MAX_SECONDS = 30
+
+async def warm_up_database(app: FastAPI):
+    # Keep retrying in the background so a database outage at boot leaves the
+    # process up (and not ready) instead of crashing the worker.
+    delay = WARM_UP_RETRY_MIN_SECONDS
+    while True:
+        try:
+            await run_in_threadpool(database.warm_up)
+        except Exception:
+            logger.exception("Database warm-up failed, retrying in %ss", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARM_UP_RETRY_MAX_SECONDS)
+        else:
+            app.state.ready = True
+            logger.info("Database pool warm, ready to serve")
+            return
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.ready = False
+    warm_up_task = asyncio.create_task(warm_up_database(app))
+    yield
+    # A warm-up attempt already running in the thread pool can't be cancelled;
+    # awaiting it is bounded by the DB_CONNECT_TIMEOUT setting, so the pool is
+    # never disposed while that thread still holds connections.
+    warm_up_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warm_up_task
+    database.dispose_engine()
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+app = FastAPI(title="Health & Fitness Monitor", lifespan=lifespan)
+
+# Security Configuration
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 # --- Helper Functions ---
 
+@lru_cache(maxsize=None)
+def get_settings():
+    # Resolved on first use so importing this module doesn't read .env
+    database.load_env()
+    return {
+        "secret_key": os.getenv("SECRET_KEY", "supersecretkeyShouldBeChangeInProduction"),
+        "algorithm": os.getenv("ALGORITHM", "HS256"),
+        "access_token_expire_minutes": int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30)),
+    }
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    # passlib/argon2 are only needed once someone logs in or registers
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["argon2"], deprecated="auto")
+
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
+    from jose import jwt
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    settings = get_settings()
+    encoded_jwt = jwt.encode(to_encode, settings["secret_key"], algorithm=settings["algorithm"])
     return encoded_jwt
 
 async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)], db: Session = Depends(database.get_db)):
+    from jose import JWTError, jwt
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        settings = get_settings()
+        payload = jwt.decode(token, settings["secret_key"], algorithms=[settings["algorithm"]])
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -62,6 +114,18 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)], db: Se
         raise credentials_exception
     return user
 
+# --- Health Endpoints ---
+
+@app.get("/health/live")
+def liveness():
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+def readiness():
+    if not getattr(app.state, "ready", False):
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Database pool is warming up")
+    return {"status": "ready"}
+
 # --- Auth Endpoints ---
 
 @app.post("/token", response_model=schemas.Token)
@@ -73,7 +137,7 @@ async def login_for_access_token(form_data: Annotated[OAuth2PasswordRequestForm,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token_expires = timedelta(minutes=get_settings()["access_token_expire_minutes"])
     access_token = create_access_token(
         data={"sub": user.username}, expires_delta=access_token_expires
     )
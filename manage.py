@@ -0,0 +1,30 @@
+import argparse
+
+import database
+
+# Schema management lives here rather than in main.py so that starting the API
+# never needs a database round-trip. Run `python manage.py init-db` once per
+# database (and again after adding tables).
+
+def init_db():
+    import models
+    models.Base.metadata.create_all(bind=database.get_engine())
+    print("Database schema is up to date.")
+
+def check_db():
+    database.warm_up()
+    print("Database connection OK.")
+
+COMMANDS = {
+    "init-db": init_db,
+    "check-db": check_db,
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Health & Fitness Monitor management commands")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args(argv)
+    COMMANDS[args.command]()
+
+if __name__ == "__main__":
+    main()
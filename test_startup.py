@@ -0,0 +1,106 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import SingletonThreadPool
+
+import database
+import main
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+real_load_env = database.load_env
+
+@pytest.fixture(autouse=True)
+def sqlite_db(monkeypatch):
+    # In-memory SQLite, no .env, and fast retries for the failure case
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+    monkeypatch.setattr(database, "load_env", lambda path=".env": None)
+    monkeypatch.setattr(main, "WARM_UP_RETRY_MIN_SECONDS", 0.01)
+    database.dispose_engine()
+    yield
+    database.dispose_engine()
+
+def wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+def test_import_does_not_touch_database_or_env():
+    code = (
+        "import database, main\n"
+        "assert database._engine is None\n"
+        "assert database.load_env.cache_info().currsize == 0\n"
+    )
+    # An unroutable host: any connection attempt at import would fail/hang
+    env = {**os.environ, "DATABASE_URL": "postgresql://nobody@203.0.113.1/none"}
+    subprocess.run([sys.executable, "-c", code], cwd=HERE, env=env, check=True, timeout=30)
+
+def test_warm_up_sqlite_memory():
+    database.warm_up()
+    assert isinstance(database.get_engine().pool, SingletonThreadPool)
+
+def test_connect_timeout_from_env_file(monkeypatch, tmp_path):
+    (tmp_path / ".env").write_text(
+        "DATABASE_URL=postgresql://nobody@localhost/none\nDB_CONNECT_TIMEOUT=1\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DATABASE_URL")
+    monkeypatch.delenv("DB_CONNECT_TIMEOUT", raising=False)
+    # Bypass the cache so this .env is actually read
+    monkeypatch.setattr(database, "load_env", lambda path=".env": real_load_env.__wrapped__(path))
+    fake_create_engine = mock.Mock(return_value=mock.Mock())
+    monkeypatch.setattr(database, "create_engine", fake_create_engine)
+
+    database.get_engine()
+
+    _, kwargs = fake_create_engine.call_args
+    assert kwargs["connect_args"] == {"connect_timeout": 1}
+
+def test_get_engine_is_shared_across_threads():
+    engines = []
+    threads = [threading.Thread(target=lambda: engines.append(database.get_engine())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(e) for e in engines}) == 1
+
+def test_ready_after_warm_up():
+    with TestClient(main.app) as client:
+        assert client.get("/health/live").status_code == 200
+        assert wait_until(lambda: client.get("/health/ready").status_code == 200)
+
+def test_not_ready_until_warm_up_finishes(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(database, "warm_up", lambda: release.wait(5))
+    with TestClient(main.app) as client:
+        try:
+            response = client.get("/health/ready")
+            assert response.status_code == 503
+            assert client.get("/health/live").status_code == 200
+        finally:
+            release.set()
+        assert wait_until(lambda: client.get("/health/ready").status_code == 200)
+
+def test_failing_warm_up_keeps_app_alive_and_retrying(monkeypatch):
+    calls = []
+
+    def failing_warm_up():
+        calls.append(1)
+        raise OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+    monkeypatch.setattr(database, "warm_up", failing_warm_up)
+    with TestClient(main.app) as client:
+        assert wait_until(lambda: len(calls) >= 3)
+        assert client.get("/health/live").status_code == 200
+        assert client.get("/health/ready").status_code == 503